@@ -1,12 +1,12 @@
-import json
 import random
-import re
-import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from js import document, window
-from pyodide.ffi import create_proxy
+from js import Object, document, window
+from pyodide.ffi import create_proxy, to_js
+from pyodide.http import pyfetch
 
 
 # ────────── DOM helpers ──────────
@@ -15,23 +15,119 @@ def qs(sel: str):
     return document.querySelector(sel)
 
 
-def show(sel: str, visible: bool):
-    el = qs(sel)
+_HTML_ESCAPE = str.maketrans({
+    "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;",
+})
+
+
+def esc(s: str) -> str:
+    """HTML-escape text for innerHTML templates (same output as html.escape)."""
+    return s.translate(_HTML_ESCAPE)
+
+
+class DOM:
+    """Static page elements, looked up once by cache_dom().
+
+    Attribute names are the element ids with "-" replaced by "_".
+    """
+    status: Any = None
+    # Setup
+    category_grid: Any = None
+    team_name_input: Any = None
+    add_team_btn: Any = None
+    team_list: Any = None
+    start_btn: Any = None
+    # Hand-off
+    handoff_team: Any = None
+    handoff_round: Any = None
+    handoff_dots: Any = None
+    # Turn
+    turn_team: Any = None
+    turn_round: Any = None
+    turn_dots: Any = None
+    prompt: Any = None
+    guess_input: Any = None
+    game_menu: Any = None
+    # Reveal / overlays
+    result_area: Any = None
+    sb_overlay: Any = None
+    scoreboard: Any = None
+    winner_overlay: Any = None
+    winner_trophy: Any = None
+    winner_title: Any = None
+    winner_name: Any = None
+    winner_score: Any = None
+    winner_scoreboard: Any = None
+
+
+def cache_dom():
+    for attr in DOM.__annotations__:
+        setattr(DOM, attr, qs("#" + attr.replace("_", "-")))
+
+
+def show(el, visible: bool):
     if visible:
         el.classList.remove("hidden")
     else:
         el.classList.add("hidden")
 
 
+# Status writes are coalesced: only the last message of a frame is rendered
+_pending_status: Optional[str] = None
+
+
+def _flush_status(ts=None):
+    global _pending_status
+    if _pending_status is None:  # already written by set_status_now()
+        return
+    DOM.status.innerText = _pending_status
+    _pending_status = None
+
+
+_flush_status_proxy = create_proxy(_flush_status)
+
+
 def set_status(msg: str):
-    qs("#status").innerText = msg
+    global _pending_status
+    if _pending_status is None:
+        window.requestAnimationFrame(_flush_status_proxy)
+    _pending_status = msg
 
 
+def set_status_now(msg: str):
+    """Write immediately, dropping any queued message (for errors)."""
+    global _pending_status
+    _pending_status = None
+    DOM.status.innerText = msg
+
+
+class _PunctTable(dict):
+    """translate() table dropping chars outside \\w / \\s, classified lazily."""
+
+    def __init__(self):
+        super().__init__()
+        # ASCII (the common case) is classified up front
+        for c in range(128):
+            self.__missing__(c)
+
+    def __missing__(self, c: int) -> Optional[int]:
+        ch = chr(c)
+        keep = ch.isalnum() or ch == "_" or ch.isspace()
+        self[c] = c if keep else None
+        return self[c]
+
+
+_PUNCT_TABLE = _PunctTable()
+
+
+@lru_cache(maxsize=4096)
 def normalize(s: str) -> str:
-    s = (s or "").strip().lower()
-    s = re.sub(r"[^\w\s]", "", s, flags=re.UNICODE)
-    s = re.sub(r"\s+", " ", s)
-    return s
+    s = (s or "").strip()
+    # Already-normalized text (most aliases) needs no rewriting
+    if s.isascii() and s.islower() and "  " not in s and s.replace(" ", "").isalnum():
+        return s
+    s = s.lower().translate(_PUNCT_TABLE)
+    return " ".join(s.split())
 
 
 # ────────── Constants ──────────
@@ -42,13 +138,14 @@ MAX_TEAMS = 8
 # Keep JS proxies alive (prevent GC)
 PROXIES: list = []
 
-# Debounce
-_last_action_ts = 0.0
+# Debounce (monotonic ms clock since page load, bound once)
+_perf_now = window.performance.now
+_last_action_ts = float("-inf")
 
 
 def allow_action(min_ms: int = 350) -> bool:
     global _last_action_ts
-    now = time.time() * 1000.0
+    now = _perf_now()
     if now - _last_action_ts < min_ms:
         return False
     _last_action_ts = now
@@ -67,6 +164,9 @@ TEAM_COLORS = [
     "#e879f9",  # fuchsia
 ]
 
+# Inline style for each slot's setup chip (tinted border + background)
+TEAM_CHIP_STYLES = [f"border-color:{c}55;background:{c}14" for c in TEAM_COLORS]
+
 # Emoji map for category cards
 CATEGORY_EMOJIS: Dict[str, str] = {
     "Sports": "⚽",
@@ -85,68 +185,93 @@ CATEGORY_EMOJIS: Dict[str, str] = {
 
 # ────────── Sound helpers ──────────
 
+# sounds.js is loaded before Pyodide, so the engine's methods are bound once
+# at import and each effect is a single JS call
+try:
+    _audio_play = window.GameAudio.play
+    _audio_play_reveal = window.GameAudio.playRevealResult
+    _audio_start_music = window.GameAudio.startMusic
+    _audio_stop_music = window.GameAudio.stopMusic
+    _audio_ok = True
+except AttributeError:
+    _audio_ok = False
+
+
+def _sound(fn):
+    """Skip when audio is unavailable; turn it off after the first JS error."""
+    def run(*args):
+        global _audio_ok
+        if not _audio_ok:
+            return
+        try:
+            fn(*args)
+        except Exception:
+            _audio_ok = False
+    return run
+
+
+@_sound
 def play_sound(name: str):
-    try:
-        window.GameAudio.play(name)
-    except Exception:
-        pass
+    _audio_play(name)
 
 
+@_sound
 def play_reveal_result(best_pts: int):
-    try:
-        window.GameAudio.playRevealResult(best_pts)
-    except Exception:
-        pass
+    _audio_play_reveal(best_pts)
 
 
+@_sound
 def start_music():
-    try:
-        window.GameAudio.startMusic()
-    except Exception:
-        pass
+    _audio_start_music()
 
 
+@_sound
 def stop_music():
-    try:
-        window.GameAudio.stopMusic()
-    except Exception:
-        pass
+    _audio_stop_music()
 
 
 # ────────── Data models ──────────
 
-@dataclass
-class Answer:
-    name: str
-    fact: Optional[float] = None
-    aliases: List[str] = field(default_factory=list)
-
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Prompt:
     id: str
     category: str
     prompt: str
     fact_label: str = ""
     fact_unit: str = ""
-    answers: List[Answer] = field(default_factory=list)
-
-
-@dataclass
+    # Answers, best-known first, as parallel lists (one entry per rank)
+    names: List[str] = field(default_factory=list)
+    facts: List[Optional[float]] = field(default_factory=list)
+    aliases: List[Sequence[str]] = field(default_factory=list)
+    # Pre-escaped text for the reveal's innerHTML; fact_prefix_html is
+    # "" when the prompt has no fact column
+    prompt_html: str = ""
+    names_html: List[str] = field(default_factory=list)
+    fact_prefix_html: str = ""
+    fact_unit_html: str = ""
+
+
+@dataclass(slots=True)
 class GameState:
     teams: List[str] = field(default_factory=list)
-    scores: Dict[str, int] = field(default_factory=dict)
+    scores: List[int] = field(default_factory=list)  # indexed like teams
+    ranked_teams: List[int] = field(default_factory=list)  # team indices, high score first
+    team_colors: List[str] = field(default_factory=list)  # indexed like teams
     round_num: int = 0
     completed_rounds: int = 0
 
     all_prompts: List[Prompt] = field(default_factory=list)
+    available_packs: List[str] = field(default_factory=list)
+    by_category: Dict[str, List[Prompt]] = field(default_factory=dict)
     prompts: List[Prompt] = field(default_factory=list)
-    used_prompt_ids: set = field(default_factory=set)
+    deck: List[Prompt] = field(default_factory=list)  # undealt prompts, shuffled
+    pack_exhausted: bool = False  # deck now holds prompts from other packs
+    # (prompt id, normalized answer or alias) → rank, for every prompt
+    norm_index: Dict[Tuple[str, str], int] = field(default_factory=dict)
 
     current_prompt: Optional[Prompt] = None
     current_team_idx: int = 0
-    guesses: Dict[str, str] = field(default_factory=dict)
-    current_lookup: Dict[str, int] = field(default_factory=dict)
+    guesses: List[str] = field(default_factory=list)  # indexed like teams
 
     selected_pack: str = "__all__"
 
@@ -156,65 +281,78 @@ STATE = GameState()
 
 # ────────── Loading prompts ──────────
 
-def load_prompts() -> List[Prompt]:
-    with open("prompts.json", "r", encoding="utf-8") as f:
-        raw = json.load(f)
+_prompt_fields = itemgetter("id", "prompt", "answers")
+
+
+async def load_prompts() -> List[Prompt]:
+    # Fetched rather than read from the virtual FS so the UI can paint meanwhile.
+    # The browser's native JSON parser builds the tree; to_py() converts it in bulk.
+    resp = await pyfetch("prompts.json")
+    raw = (await resp.js_response.json()).to_py()
 
     prompts: List[Prompt] = []
     for item in raw:
-        answers: List[Answer] = []
-        for a in item["answers"]:
-            answers.append(Answer(
-                name=a["name"],
-                fact=a.get("fact", None),
-                aliases=a.get("aliases", []),
-            ))
+        pid, text, answers = _prompt_fields(item)
+        fact_label = item.get("fact_label", "")
+        fact_unit = item.get("fact_unit", "")
+        names = [a["name"] for a in answers]
         prompts.append(Prompt(
-            id=item["id"],
+            id=pid,
             category=item.get("category", "Uncategorized"),
-            prompt=item["prompt"],
-            fact_label=item.get("fact_label", ""),
-            fact_unit=item.get("fact_unit", ""),
-            answers=answers,
+            prompt=text,
+            fact_label=fact_label,
+            fact_unit=fact_unit,
+            names=names,
+            facts=[a.get("fact", None) for a in answers],
+            aliases=[a.get("aliases", ()) for a in answers],
+            prompt_html=esc(text),
+            names_html=[esc(n) for n in names],
+            fact_prefix_html=esc(fact_label or "Fact") + ": " if fact_label or fact_unit else "",
+            fact_unit_html=esc(fact_unit or ""),
         ))
     return prompts
 
 
-def get_available_packs(prompts: List[Prompt]) -> List[str]:
-    return sorted({p.category for p in prompts})
-
-
 def apply_pack_filter():
     pack = STATE.selected_pack
     if pack == "__all__":
         STATE.prompts = STATE.all_prompts[:]
     else:
-        STATE.prompts = [p for p in STATE.all_prompts if p.category == pack]
-    STATE.used_prompt_ids = set()
+        STATE.prompts = STATE.by_category.get(pack, [])[:]
+    STATE.deck = random.sample(STATE.prompts, len(STATE.prompts))
+    STATE.pack_exhausted = False
+
+
+def refill_deck():
+    if not STATE.pack_exhausted:
+        # Fallback: the rest of ALL categories, none of them dealt yet
+        STATE.pack_exhausted = True
+        pack = STATE.selected_pack
+        rest = [] if pack == "__all__" else [p for p in STATE.all_prompts if p.category != pack]
+        STATE.deck = random.sample(rest, len(rest))
+    if not STATE.deck:
+        # Ultimate fallback: every prompt has been dealt, reshuffle them all
+        deck = random.sample(STATE.all_prompts, len(STATE.all_prompts))
+        # Don't deal the prompt just played straight back
+        if len(deck) > 1 and deck[-1] is STATE.current_prompt:
+            deck[0], deck[-1] = deck[-1], deck[0]
+        STATE.deck = deck
 
 
 def pick_next_prompt() -> Prompt:
-    available = [p for p in STATE.prompts if p.id not in STATE.used_prompt_ids]
-    if not available:
-        # Fallback: pull from ALL categories
-        available = [p for p in STATE.all_prompts if p.id not in STATE.used_prompt_ids]
-    if not available:
-        # Ultimate fallback: reset
-        STATE.used_prompt_ids = set()
-        available = STATE.all_prompts[:]
-    p = random.choice(available)
-    STATE.used_prompt_ids.add(p.id)
-    return p
-
-
-def build_lookup(prompt: Prompt) -> Dict[str, int]:
+    if not STATE.deck:
+        refill_deck()
+    return STATE.deck.pop()
+
+
+def build_lookup(names: List[str], aliases: List[Sequence[str]]) -> Dict[str, int]:
     lookup: Dict[str, int] = {}
-    for idx, ans in enumerate(prompt.answers):
+    for idx, (name, name_aliases) in enumerate(zip(names, aliases)):
         rank = idx + 1
-        k = normalize(ans.name)
+        k = normalize(name)
         if k:
             lookup[k] = rank
-        for al in ans.aliases:
+        for al in name_aliases:
             ak = normalize(al)
             if ak:
                 lookup[ak] = rank
@@ -228,80 +366,79 @@ PHASES = ["#setup-area", "#handoff-area", "#game-area", "#result-area"]
 
 def show_phase(phase_id: str):
     """Show exactly one phase, hide the rest."""
-    for pid in PHASES:
-        show(pid, pid == phase_id)
+    vis = {pid: pid == phase_id for pid in PHASES}
+    window.showMany(to_js(vis, dict_converter=Object.fromEntries))
 
 
 # ────────── Category cards ──────────
 
-def populate_category_cards():
-    grid = qs("#category-grid")
-    grid.innerHTML = ""
+# (value, element) for every category card, in grid order
+CAT_CARDS: list = []
+
 
+def populate_category_cards():
     # "All categories" – full width
-    all_card = _make_cat_card("__all__", "🎲", "All Categories")
-    all_card.classList.add("cat-card-wide")
-    all_card.classList.add("selected")
-    grid.appendChild(all_card)
+    cards = [_cat_card_html("__all__", "🎲", "All Categories", "cat-card cat-card-wide selected")]
 
-    for pack in get_available_packs(STATE.all_prompts):
+    for pack in STATE.available_packs:
         emoji = CATEGORY_EMOJIS.get(pack, "❓")
-        card = _make_cat_card(pack, emoji, pack)
-        grid.appendChild(card)
+        cards.append(_cat_card_html(pack, emoji, pack))
+    grid = DOM.category_grid
+    grid.innerHTML = "".join(cards)
 
+    els = grid.children
+    values = ["__all__"] + STATE.available_packs
+    CAT_CARDS[:] = [(v, els.item(i)) for i, v in enumerate(values)]
 
-def _make_cat_card(value: str, emoji: str, label: str):
-    card = document.createElement("button")
-    card.className = "cat-card"
-    card.dataset.value = value
-    card.innerHTML = f"<span class='cat-emoji'>{emoji}</span>{label}"
 
-    def _click(evt=None):
-        select_category(value)
-    p = create_proxy(_click)
-    PROXIES.append(p)
-    card.addEventListener("pointerup", p)
-    return card
+def _cat_card_html(value: str, emoji: str, label: str, cls: str = "cat-card") -> str:
+    return (
+        f"<button class='{cls}' data-action='select-cat' data-value='{esc(value)}'>"
+        f"<span class='cat-emoji'>{emoji}</span>{esc(label)}"
+        f"</button>"
+    )
 
 
 def select_category(value: str):
     STATE.selected_pack = value
-    cards = document.querySelectorAll(".cat-card")
-    for i in range(cards.length):
-        c = cards.item(i)
-        if c.dataset.value == value:
-            c.classList.add("selected")
-        else:
-            c.classList.remove("selected")
+    for card_value, el in CAT_CARDS:
+        el.classList.toggle("selected", card_value == value)
     play_sound("click")
 
 
 # ────────── Progress dots ──────────
 
-def render_dots(container_sel: str):
-    el = qs(container_sel)
-    el.innerHTML = ""
+def _dots_html(completed: int) -> str:
+    dots: List[str] = []
     for i in range(MAX_ROUNDS):
-        d = document.createElement("div")
-        d.className = "dot"
-        if i < STATE.completed_rounds:
-            d.classList.add("filled")
-        elif i == STATE.completed_rounds:
-            d.classList.add("current")
-        el.appendChild(d)
+        if i < completed:
+            dots.append("<div class='dot filled'></div>")
+        elif i == completed:
+            dots.append("<div class='dot current'></div>")
+        else:
+            dots.append("<div class='dot'></div>")
+    return "".join(dots)
+
+
+# One string per completed_rounds value (0..MAX_ROUNDS)
+_DOT_HTMLS = [_dots_html(c) for c in range(MAX_ROUNDS + 1)]
+
+
+def render_dots(el):
+    el.innerHTML = _DOT_HTMLS[STATE.completed_rounds]
 
 
 # ────────── Hand-off screen ──────────
 
 def show_handoff():
     team = STATE.teams[STATE.current_team_idx]
-    color = TEAM_COLORS[STATE.current_team_idx % len(TEAM_COLORS)]
+    color = STATE.team_colors[STATE.current_team_idx]
 
-    qs("#handoff-team").innerText = team
-    qs("#handoff-team").style.color = color
-    qs("#handoff-round").innerText = f"Round {STATE.completed_rounds + 1} of {MAX_ROUNDS}"
+    DOM.handoff_team.innerText = team
+    DOM.handoff_team.style.color = color
+    DOM.handoff_round.innerText = f"Round {STATE.completed_rounds + 1} of {MAX_ROUNDS}"
 
-    render_dots("#handoff-dots")
+    render_dots(DOM.handoff_dots)
     show_phase("#handoff-area")
 
 
@@ -309,44 +446,70 @@ def show_handoff():
 
 def show_turn():
     team = STATE.teams[STATE.current_team_idx]
-    color = TEAM_COLORS[STATE.current_team_idx % len(TEAM_COLORS)]
+    color = STATE.team_colors[STATE.current_team_idx]
 
-    qs("#turn-team").innerText = f"{team}'s Turn"
-    qs("#turn-team").style.color = color
-    qs("#turn-round").innerText = f"Round {STATE.completed_rounds + 1} of {MAX_ROUNDS}"
+    DOM.turn_team.innerText = f"{team}'s Turn"
+    DOM.turn_team.style.color = color
+    DOM.turn_round.innerText = f"Round {STATE.completed_rounds + 1} of {MAX_ROUNDS}"
 
-    render_dots("#turn-dots")
+    render_dots(DOM.turn_dots)
 
-    qs("#prompt").innerText = STATE.current_prompt.prompt if STATE.current_prompt else "—"
-    qs("#guess-input").value = ""
+    DOM.prompt.innerText = STATE.current_prompt.prompt if STATE.current_prompt else "—"
+    DOM.guess_input.value = ""
 
     # Close menu if open
-    qs("#game-menu").classList.add("hidden")
+    DOM.game_menu.classList.add("hidden")
 
     show_phase("#game-area")
-    qs("#guess-input").focus()
+    DOM.guess_input.focus()
 
 
 # ────────── Scoreboard (overlay sheet) ──────────
 
+# Row / score elements per team index, plus what they currently display
+SCORE_ROWS: list = []
+SCORE_CELLS: list = []
+_shown_scores: List[int] = []
+_shown_order: List[int] = []
+# Set when scores change; the sheet is only re-rendered when it is opened
+_scoreboard_dirty = False
+
+
+def build_scoreboard():
+    """Create one row per team; render_scoreboard() then only patches them."""
+    sb = DOM.scoreboard
+    sb.innerHTML = "".join(
+        f"<div class='score-row'>"
+        f"<div><strong>{esc(team)}</strong></div>"
+        f"<div><strong>0</strong> pts</div>"
+        f"</div>"
+        for team in STATE.teams
+    )
+    rows = sb.children
+    SCORE_ROWS[:] = [rows.item(i) for i in range(len(STATE.teams))]
+    SCORE_CELLS[:] = [row.lastElementChild.firstElementChild for row in SCORE_ROWS]
+    _shown_scores[:] = [0] * len(STATE.teams)
+    _shown_order[:] = range(len(STATE.teams))
+
+
 def render_scoreboard():
-    sb = qs("#scoreboard")
-    sb.innerHTML = ""
-    for team in sorted(STATE.teams, key=lambda t: STATE.scores.get(t, 0), reverse=True):
-        score = STATE.scores.get(team, 0)
-        row = document.createElement("div")
-        row.className = "score-row"
-        row.innerHTML = (
-            f"<div><strong>{team}</strong></div>"
-            f"<div><strong>{score}</strong> pts</div>"
-        )
-        sb.appendChild(row)
+    global _scoreboard_dirty
+    _scoreboard_dirty = False
+    for i, score in enumerate(STATE.scores):
+        if _shown_scores[i] != score:
+            SCORE_CELLS[i].innerText = str(score)
+            _shown_scores[i] = score
+    if _shown_order != STATE.ranked_teams:
+        # append() moves the existing rows into the new order in one call
+        DOM.scoreboard.append(*[SCORE_ROWS[i] for i in STATE.ranked_teams])
+        _shown_order[:] = STATE.ranked_teams
 
 
 def show_scoreboard():
-    render_scoreboard()
-    qs("#sb-overlay").classList.remove("hidden")
-    qs("#game-menu").classList.add("hidden")
+    if _scoreboard_dirty:
+        render_scoreboard()
+    show(DOM.sb_overlay, True)
+    show(DOM.game_menu, False)
 
 
 # ────────── Reveal ──────────
@@ -355,8 +518,7 @@ def render_reveal(results: List[Tuple[str, str, int, Optional[int]]]):
     """
     results items: (team, guess, points_awarded, rank_or_None)
     """
-    ra = qs("#result-area")
-    ra.innerHTML = ""
+    ra = DOM.result_area
 
     prompt = STATE.current_prompt
     if not prompt:
@@ -364,46 +526,6 @@ def render_reveal(results: List[Tuple[str, str, int, Optional[int]]]):
         show_phase("#result-area")
         return
 
-    # ── Header ──
-    header = document.createElement("div")
-    header.className = "reveal-header"
-
-    h2 = document.createElement("h2")
-    h2.innerText = "Reveal"
-    header.appendChild(h2)
-
-    q = document.createElement("div")
-    q.className = "reveal-question"
-    q.innerHTML = (
-        f"<div class='reveal-label'>Prompt</div>"
-        f"<div class='reveal-prompt'>{prompt.prompt}</div>"
-    )
-    header.appendChild(q)
-
-    callout = document.createElement("div")
-    callout.className = "reveal-callout"
-    callout.innerHTML = "Remember: <strong>#10 = 10 points</strong> (higher rank = more points)"
-    header.appendChild(callout)
-    ra.appendChild(header)
-
-    # ── Grid ──
-    grid = document.createElement("div")
-    grid.className = "reveal-grid"
-    ra.appendChild(grid)
-
-    # Left panel: team results
-    left = document.createElement("div")
-    left.className = "reveal-panel"
-    grid.appendChild(left)
-
-    lh = document.createElement("h3")
-    lh.innerText = "Team Results"
-    left.appendChild(lh)
-
-    list_el = document.createElement("div")
-    list_el.className = "reveal-results"
-    left.appendChild(list_el)
-
     def cls_for(points: int, rank) -> str:
         if rank == 10 or points == 10:
             return "hit-perfect"
@@ -413,105 +535,94 @@ def render_reveal(results: List[Tuple[str, str, int, Optional[int]]]):
             return "hit-good"
         return "hit-miss"
 
-    for (team, guess, pts, rank) in results:
-        row = document.createElement("div")
-        row.className = f"reveal-row {cls_for(pts, rank)}"
-
-        team_el = document.createElement("div")
-        team_el.className = "reveal-team"
-        team_el.innerHTML = (
-            f"<div class='team-name'>{team}</div>"
-            f"<div class='team-guess'>{guess or '—'}</div>"
-        )
+    # The whole reveal is built as one string and written with a single
+    # innerHTML assignment (one parse + layout instead of one per element).
+
+    # ── Header ──
+    parts: List[str] = [
+        "<div class='reveal-header'>"
+        "<h2>Reveal</h2>"
+        "<div class='reveal-question'>"
+        "<div class='reveal-label'>Prompt</div>"
+        f"<div class='reveal-prompt'>{prompt.prompt_html}</div>"
+        "</div>"
+        "<div class='reveal-callout'>"
+        "Remember: <strong>#10 = 10 points</strong> (higher rank = more points)"
+        "</div>"
+        "</div>"
+    ]
+
+    # ── Grid ──
+    parts.append("<div class='reveal-grid'>")
 
-        meta_el = document.createElement("div")
-        meta_el.className = "reveal-meta"
+    # Left panel: team results
+    parts.append(
+        "<div class='reveal-panel'>"
+        "<h3>Team Results</h3>"
+        "<div class='reveal-results'>"
+    )
+    for (team, guess, pts, rank) in results:
         rank_text = f"#{rank}" if rank is not None else "Miss"
-        meta_el.innerHTML = (
+        parts.append(
+            f"<div class='reveal-row {cls_for(pts, rank)}'>"
+            f"<div class='reveal-team'>"
+            f"<div class='team-name'>{esc(team)}</div>"
+            f"<div class='team-guess'>{esc(guess) or '—'}</div>"
+            f"</div>"
+            f"<div class='reveal-meta'>"
             f"<div class='badge badge-rank'>{rank_text}</div>"
             f"<div class='badge badge-points'>+{pts} pts</div>"
+            f"</div>"
+            f"</div>"
         )
-
-        row.appendChild(team_el)
-        row.appendChild(meta_el)
-        list_el.appendChild(row)
+    parts.append("</div></div>")
 
     # Right panel: actual top 10
-    right = document.createElement("div")
-    right.className = "reveal-panel"
-    grid.appendChild(right)
-
-    rh = document.createElement("h3")
-    rh.innerText = "Actual Top 10"
-    right.appendChild(rh)
+    parts.append(
+        "<div class='reveal-panel'>"
+        "<h3>Actual Top 10</h3>"
+        "<div class='top10'>"
+    )
 
-    topwrap = document.createElement("div")
-    topwrap.className = "top10"
-    right.appendChild(topwrap)
+    # Fact label/unit are per prompt, escaped at load
+    prefix = prompt.fact_prefix_html
+    unit = prompt.fact_unit_html
 
-    for i, ans in enumerate(prompt.answers, start=1):
-        item = document.createElement("div")
-        item.className = "top10-item"
-        if i == 10:
-            item.classList.add("top10-ten")
+    for i, (name, fact) in enumerate(zip(prompt.names_html, prompt.facts), start=1):
+        item_cls = "top10-item top10-ten" if i == 10 else "top10-item"
 
         fact_html = ""
-        if ans.fact is not None and (prompt.fact_label or prompt.fact_unit):
-            label = prompt.fact_label or "Fact"
-            unit = prompt.fact_unit or ""
-            fact_html = f"<div class='top10-fact'>{label}: {ans.fact}{unit}</div>"
+        if prefix and fact is not None:
+            fact_html = f"<div class='top10-fact'>{prefix}{fact}{unit}</div>"
 
-        item.innerHTML = (
+        parts.append(
+            f"<div class='{item_cls}'>"
             f"<div class='top10-rank'>#{i}</div>"
-            f"<div class='top10-name'>{ans.name}</div>"
+            f"<div class='top10-name'>{name}</div>"
             f"{fact_html}"
+            f"</div>"
         )
-        topwrap.appendChild(item)
+    parts.append("</div></div>")
+
+    parts.append("</div>")  # .reveal-grid
 
     # ── Footer ──
     is_final = STATE.completed_rounds >= MAX_ROUNDS
 
     if not is_final:
-        footer = document.createElement("div")
-        footer.className = "reveal-footer"
-        ra.appendChild(footer)
-
-        btn = document.createElement("button")
-        btn.className = "btn"
-        btn.innerText = "Next Round ➜"
-        footer.appendChild(btn)
-
-        def _next(evt=None):
-            if not allow_action():
-                return
-            next_round()
+        parts.append(
+            "<div class='reveal-footer'>"
+            "<button class='btn' data-action='next-round'>Next Round ➜</button>"
+            "</div>"
+        )
 
-        p = create_proxy(_next)
-        PROXIES.append(p)
-        btn.addEventListener("pointerup", p)
+    ra.innerHTML = "".join(parts)
 
     show_phase("#result-area")
-    render_scoreboard()
 
     # Auto-transition to winner after last round
     if is_final:
-        def _show_winner():
-            show_winner_overlay()
-        p = create_proxy(_show_winner)
-        PROXIES.append(p)
-        window.setTimeout(p, 3500)
-
-
-# ────────── Scoring ──────────
-
-def score_guess(guess: str) -> Tuple[int, Optional[int]]:
-    g = normalize(guess)
-    if not g:
-        return 0, None
-    rank = STATE.current_lookup.get(g)
-    if rank is None:
-        return 0, None
-    return rank, rank  # points = rank position
+        window.setTimeout(_show_winner_proxy, 3500)
 
 
 # ────────── Winner overlay ──────────
@@ -523,38 +634,42 @@ def show_winner_overlay():
     if not STATE.teams:
         return
 
-    max_score = max(STATE.scores.get(t, 0) for t in STATE.teams)
-    winners = [t for t in STATE.teams if STATE.scores.get(t, 0) == max_score]
-
-    qs("#winner-trophy").innerText = "🏆"
-    qs("#winner-title").innerText = "It's a Tie!" if len(winners) > 1 else "Winner!"
-    qs("#winner-name").innerText = " & ".join(winners)
-    qs("#winner-score").innerText = f"{max_score} pts"
-
-    sb = qs("#winner-scoreboard")
-    sb.innerHTML = ""
-    for team in sorted(STATE.teams, key=lambda t: STATE.scores.get(t, 0), reverse=True):
-        score = STATE.scores.get(team, 0)
-        row = document.createElement("div")
-        row.className = "winner-sb-row"
-        if team in winners:
-            row.classList.add("winner-sb-highlight")
-        row.innerHTML = f"<span>{team}</span><span>{score} pts</span>"
-        sb.appendChild(row)
-
-    overlay = qs("#winner-overlay")
+    max_score = STATE.scores[STATE.ranked_teams[0]]
+    winners = [STATE.teams[i] for i in STATE.ranked_teams if STATE.scores[i] == max_score]
+
+    DOM.winner_trophy.innerText = "🏆"
+    DOM.winner_title.innerText = "It's a Tie!" if len(winners) > 1 else "Winner!"
+    DOM.winner_name.innerText = " & ".join(winners)
+    DOM.winner_score.innerText = f"{max_score} pts"
+
+    rows: List[str] = []
+    for i in STATE.ranked_teams:
+        score = STATE.scores[i]
+        cls = "winner-sb-row winner-sb-highlight" if score == max_score else "winner-sb-row"
+        rows.append(
+            f"<div class='{cls}'>"
+            f"<span>{esc(STATE.teams[i])}</span><span>{score} pts</span>"
+            f"</div>"
+        )
+    DOM.winner_scoreboard.innerHTML = "".join(rows)
+
+    overlay = DOM.winner_overlay
     overlay.classList.remove("hidden")
     overlay.offsetHeight  # force reflow for animation
     overlay.classList.add("visible")
 
 
+# Reused for every game's end-of-game timeout
+_show_winner_proxy = create_proxy(show_winner_overlay)
+
+
 # ────────── Team management ──────────
 
 ADDED_TEAMS: List[str] = []
 
 
 def add_team():
-    inp = qs("#team-name-input")
+    inp = DOM.team_name_input
     name = (inp.value or "").strip()
     if not name:
         return
@@ -582,43 +697,26 @@ def remove_team(name: str):
 
 
 def render_team_list():
-    container = qs("#team-list")
-    container.innerHTML = ""
+    # Remove buttons are handled by the delegated data-action listener
+    chips: List[str] = []
     for idx, t in enumerate(ADDED_TEAMS):
-        chip = document.createElement("div")
-        chip.className = "team-chip"
-        color = TEAM_COLORS[idx % len(TEAM_COLORS)]
-        chip.style.borderColor = f"{color}55"
-        chip.style.background = f"{color}14"
-
-        span = document.createElement("span")
-        span.innerText = t
-        chip.appendChild(span)
-
-        btn = document.createElement("button")
-        btn.className = "chip-x"
-        btn.innerHTML = "&#10005;"
-        btn.title = f"Remove {t}"
-
-        def _remove(evt=None, team=t):
-            remove_team(team)
-        p = create_proxy(_remove)
-        PROXIES.append(p)
-        btn.addEventListener("pointerup", p)
-
-        chip.appendChild(btn)
-        container.appendChild(chip)
+        style = TEAM_CHIP_STYLES[idx % len(TEAM_CHIP_STYLES)]
+        name = esc(t)
+        chips.append(
+            f"<div class='team-chip' style='{style}'>"
+            f"<span>{name}</span>"
+            f"<button class='chip-x' data-action='remove-team' data-team='{name}'"
+            f" title='Remove {name}'>&#10005;</button>"
+            f"</div>"
+        )
+    DOM.team_list.innerHTML = "".join(chips)
 
 
 def update_start_visibility():
-    btn = qs("#start-btn")
-    if len(ADDED_TEAMS) >= 2:
-        btn.classList.remove("hidden")
-    else:
-        btn.classList.add("hidden")
+    show(DOM.start_btn, len(ADDED_TEAMS) >= 2)
 
-    inp = qs("#team-name-input")
-    add_btn = qs("#add-team-btn")
+    inp = DOM.team_name_input
+    add_btn = DOM.add_team_btn
     if len(ADDED_TEAMS) >= MAX_TEAMS:
         inp.disabled = True
         add_btn.disabled = True
@@ -631,30 +729,30 @@ def update_start_visibility():
 
 def reset_game():
     STATE.teams = []
-    STATE.scores = {}
+    STATE.scores = []
+    STATE.ranked_teams = []
     STATE.round_num = 0
     STATE.completed_rounds = 0
-    STATE.used_prompt_ids = set()
+    STATE.deck = []
     STATE.current_prompt = None
     STATE.current_team_idx = 0
-    STATE.guesses = {}
-    STATE.current_lookup = {}
+    STATE.guesses = []
 
     stop_music()
     ADDED_TEAMS.clear()
 
     # Hide overlays
-    overlay = qs("#winner-overlay")
+    overlay = DOM.winner_overlay
     overlay.classList.remove("visible")
     overlay.classList.add("hidden")
-    qs("#sb-overlay").classList.add("hidden")
+    DOM.sb_overlay.classList.add("hidden")
 
     show_phase("#setup-area")
     render_team_list()
     update_start_visibility()
 
-    qs("#team-name-input").value = ""
-    qs("#team-name-input").focus()
+    DOM.team_name_input.value = ""
+    DOM.team_name_input.focus()
 
 
 def start_game():
@@ -668,11 +766,14 @@ def start_game():
         return
 
     STATE.teams = list(ADDED_TEAMS)
-    STATE.scores = {t: 0 for t in STATE.teams}
+    STATE.team_colors = [TEAM_COLORS[i % len(TEAM_COLORS)] for i in range(len(STATE.teams))]
+    STATE.scores = [0] * len(STATE.teams)
+    STATE.ranked_teams = list(range(len(STATE.teams)))
     STATE.round_num = 0
     STATE.completed_rounds = 0
     STATE.current_team_idx = 0
-    STATE.guesses = {}
+    STATE.guesses = [""] * len(STATE.teams)
+    build_scoreboard()
 
     play_sound("gameStart")
     start_music()
@@ -682,23 +783,22 @@ def start_game():
 def next_round():
     STATE.round_num += 1
     STATE.current_prompt = pick_next_prompt()
-    STATE.current_lookup = build_lookup(STATE.current_prompt)
     STATE.current_team_idx = 0
-    STATE.guesses = {}
+    STATE.guesses = [""] * len(STATE.teams)
 
     play_sound("nextRound")
     show_handoff()
 
 
 def submit_guess():
+    global _scoreboard_dirty
     if not STATE.current_prompt or not STATE.teams:
         return
     if not allow_action():
         return
 
-    team = STATE.teams[STATE.current_team_idx]
-    guess = qs("#guess-input").value.strip()
-    STATE.guesses[team] = guess
+    guess = DOM.guess_input.value.strip()
+    STATE.guesses[STATE.current_team_idx] = guess
 
     if STATE.current_team_idx < len(STATE.teams) - 1:
         # More teams to go → hand off
@@ -709,12 +809,20 @@ def submit_guess():
         # All teams done → score & reveal
         STATE.completed_rounds += 1
 
+        index = STATE.norm_index
+        pid = STATE.current_prompt.id
         results: List[Tuple[str, str, int, Optional[int]]] = []
-        for t in STATE.teams:
-            g = STATE.guesses.get(t, "")
-            pts, rank = score_guess(g)
-            STATE.scores[t] = STATE.scores.get(t, 0) + pts
-            results.append((t, g, pts, rank))
+        for i, t in enumerate(STATE.teams):
+            g = STATE.guesses[i]
+            # Points = rank position; misses (and blanks) score 0
+            pts = index.get((pid, normalize(g)), 0)
+            STATE.scores[i] += pts
+            results.append((t, g, pts, pts or None))
+        # Scores only change here, so rank once per round instead of per render
+        STATE.ranked_teams = sorted(
+            range(len(STATE.teams)), key=STATE.scores.__getitem__, reverse=True
+        )
+        _scoreboard_dirty = True
 
         best_pts = max((pts for _, _, pts, _ in results), default=0)
         play_reveal_result(best_pts)
@@ -728,102 +836,90 @@ def skip_question():
     if not allow_action():
         return
 
-    STATE.used_prompt_ids.add(STATE.current_prompt.id)
     STATE.current_prompt = pick_next_prompt()
-    STATE.current_lookup = build_lookup(STATE.current_prompt)
     STATE.current_team_idx = 0
-    STATE.guesses = {}
+    STATE.guesses = [""] * len(STATE.teams)
 
     play_sound("skip")
     show_handoff()
 
 
+# ────────── Event dispatch ──────────
+
+def _guarded(fn):
+    """Wrap an action so it is debounced by allow_action()."""
+    def run(el):
+        if allow_action():
+            fn()
+    return run
+
+
+def _ready():
+    play_sound("click")
+    show_turn()
+
+
+# data-action value → handler(element)
+ACTIONS = {
+    "start": _guarded(start_game),
+    "ready": _guarded(_ready),
+    "submit": lambda el: submit_guess(),
+    "skip": lambda el: skip_question(),
+    "scores": lambda el: show_scoreboard(),
+    "new-game": _guarded(reset_game),
+    "add-team": _guarded(add_team),
+    "next-round": _guarded(next_round),
+    "remove-team": lambda el: remove_team(el.dataset.team),
+    "select-cat": lambda el: select_category(el.dataset.value),
+}
+
+
+def _on_pointerup(evt):
+    el = evt.target.closest("[data-action]")
+    if el is None or el.hasAttribute("disabled"):
+        return
+    handler = ACTIONS.get(el.dataset.action)
+    if handler:
+        handler(el)
+
+
+def _on_keydown(evt):
+    if evt.key != "Enter":
+        return
+    target_id = evt.target.id
+    if target_id == "guess-input":
+        submit_guess()
+    elif target_id == "team-name-input" and allow_action():
+        add_team()
+
+
 # ────────── Init ──────────
 
-def init():
+async def init():
+    cache_dom()
     try:
-        STATE.all_prompts = load_prompts()
+        set_status("Loading prompts…")
+        STATE.all_prompts = await load_prompts()
         STATE.prompts = STATE.all_prompts[:]
+        for p in STATE.all_prompts:
+            STATE.by_category.setdefault(p.category, []).append(p)
+            # Prompts never change after load, so normalize answers once here
+            for k, rank in build_lookup(p.names, p.aliases).items():
+                STATE.norm_index[(p.id, k)] = rank
+        STATE.available_packs = sorted(STATE.by_category)
 
         populate_category_cards()
 
-        # Start Game
-        def _start(evt=None):
-            if not allow_action():
-                return
-            start_game()
-        p = create_proxy(_start); PROXIES.append(p)
-        qs("#start-btn").addEventListener("pointerup", p)
-
-        # Hand-off → Ready
-        def _ready(evt=None):
-            if not allow_action():
-                return
-            play_sound("click")
-            show_turn()
-        p = create_proxy(_ready); PROXIES.append(p)
-        qs("#handoff-ready-btn").addEventListener("pointerup", p)
-
-        # Submit Guess
-        def _submit(evt=None):
-            submit_guess()
-        p = create_proxy(_submit); PROXIES.append(p)
-        qs("#submit-btn").addEventListener("pointerup", p)
-
-        # Enter key submits guess
-        def _keydown_guess(evt):
-            if evt.key == "Enter":
-                submit_guess()
-        p = create_proxy(_keydown_guess); PROXIES.append(p)
-        qs("#guess-input").addEventListener("keydown", p)
-
-        # Menu: Skip
-        def _skip(evt=None):
-            skip_question()
-        p = create_proxy(_skip); PROXIES.append(p)
-        qs("#skip-btn").addEventListener("pointerup", p)
-
-        # Menu: View Scores
-        def _scores(evt=None):
-            show_scoreboard()
-        p = create_proxy(_scores); PROXIES.append(p)
-        qs("#scores-btn").addEventListener("pointerup", p)
-
-        # Menu: New Game
-        def _new(evt=None):
-            if not allow_action():
-                return
-            reset_game()
-        p = create_proxy(_new); PROXIES.append(p)
-        qs("#new-game-btn").addEventListener("pointerup", p)
-
-        # Winner overlay: New Game
-        def _winner_new(evt=None):
-            if not allow_action():
-                return
-            reset_game()
-        p = create_proxy(_winner_new); PROXIES.append(p)
-        qs("#winner-new-game-btn").addEventListener("pointerup", p)
-
-        # Add Team button
-        def _add_team(evt=None):
-            if not allow_action():
-                return
-            add_team()
-        p = create_proxy(_add_team); PROXIES.append(p)
-        qs("#add-team-btn").addEventListener("pointerup", p)
-
-        # Enter key adds team
-        def _keydown_team(evt):
-            if evt.key == "Enter":
-                if allow_action():
-                    add_team()
-        p = create_proxy(_keydown_team); PROXIES.append(p)
-        qs("#team-name-input").addEventListener("keydown", p)
+        # One delegated listener per event type serves every button
+        opts = to_js({"passive": True}, dict_converter=Object.fromEntries)
+        p = create_proxy(_on_pointerup); PROXIES.append(p)
+        document.body.addEventListener("pointerup", p, opts)
+        p = create_proxy(_on_keydown); PROXIES.append(p)
+        document.body.addEventListener("keydown", p)
 
         reset_game()
         set_status("Ready ✅")
 
     except Exception as e:
-        set_status(f"INIT ERROR: {e}")
+        set_status_now(f"INIT ERROR: {e}")
         raise